@@ -1,81 +1,245 @@
 import pandas as pd
-import time
+import xlsxwriter
 import os
+import asyncio
+import time
+import sys
+import queue
+import atexit
+import logging
+from logging.handlers import QueueHandler, QueueListener
 from tkinter import Tk
 from tkinter.filedialog import askopenfilename
-from selenium import webdriver
-from selenium.webdriver.edge.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+
+# Per-row progress is INFO; set VERBOSE = False to only see problems and the result
+VERBOSE = True
+log = logging.getLogger("poll")
+log.setLevel(logging.INFO if VERBOSE else logging.WARNING)
+log.propagate = False
+# Console output is handed off to a listener thread (same setup as script2.py)
+_log_queue = queue.Queue()
+log.addHandler(QueueHandler(_log_queue))
+_log_listener = QueueListener(_log_queue, logging.StreamHandler(sys.stdout))
+_log_listener.start()
+atexit.register(_log_listener.stop)  # flush what's queued on any exit
 
 # === Step 1: Select Excel file ===
 Tk().withdraw()
 file_path = askopenfilename(title="Select Excel file", filetypes=[("Excel files", "*.xlsx")])
 if not file_path:
-    print("No file selected. Exiting.")
+    log.warning("No file selected. Exiting.")
     exit()
 
 # === Step 2: Read the Excel sheet ===
 try:
-    df = pd.read_excel(file_path, dtype=str)  # Read all cells as strings
+    df = pd.read_excel(file_path, dtype=str, engine="calamine")  # Read all cells as strings
 except Exception as e:
-    print(f"Error reading Excel file: {e}")
+    log.warning("Error reading Excel file: %s", e)
     exit()
 
-# === Step 3: Set up Edge WebDriver ===
-EDGE_DRIVER_PATH = "msedgedriver.exe"  # Adjust this path if needed
-options = webdriver.EdgeOptions()
-options.add_argument("window-size=1000,800")
-driver = webdriver.Edge(service=Service(EDGE_DRIVER_PATH), options=options)
-driver.set_window_position(100, 100)
+# === Step 3: Browser settings ===
+SITE_URL = "https://findmypollsite.vote.nyc/"
+MAX_PAGES = 8      # rows looked up at the same time, one tab each
+WAIT_MS = 10_000   # per page action
+POLL_MS = 50       # how often to check whether results have appeared
+HEADLESS = True    # set to False to watch the lookups
+CHECKPOINT_EVERY = 25  # finished lookups between checkpoint writes
+CHECKPOINT_DAYS = 7    # checkpointed answers older than this are looked up again
+CHECKPOINT_MESSAGE_HOURS = 6  # same for site messages, which may be a passing "try again later"
 
-# === Step 4: Define helper to safely extract text ===
-def safe_get_text(by, value, fallback=""):
-    try:
-        elem = driver.find_element(by, value)
-        return elem.text.strip() if elem and elem.text else fallback
-    except Exception:
-        return fallback
+# Requests the lookup doesn't need: images, fonts, media and trackers. Stylesheets
+# stay: innerText only skips text the site hides with CSS classes when CSS is applied
+BLOCKED_TYPES = {"image", "font", "media"}
+BLOCKED_HOSTS = ("google-analytics.com", "googletagmanager.com", "doubleclick.net")
 
-# Track invalid rows
-invalid_rows = []
+# === Step 4: Define helpers ===
+# True once the result block or the error message has text in it
+RESULTS_READY_JS = """() => ["assembly_district", "divMessage"].some(
+    id => (document.getElementById(id)?.innerText || "").trim())"""
+
+# Reads the error message and all six districts in one call
+READ_RESULTS_JS = """() => {
+    const text = id => (document.getElementById(id)?.innerText || "").trim();
+    return {
+        "error": text("divMessage"),
+        "AD": text("assembly_district"),
+        "ED": text("election_district").split("/")[0],
+        "Cong D": text("congress_district"),
+        "SD": text("senate_district"),
+        "Council D": text("council_district"),
+        "JD": text("judicial_district")
+    };
+}"""
+
+async def block_extras(route):
+    req = route.request
+    if req.resource_type in BLOCKED_TYPES or any(host in req.url for host in BLOCKED_HOSTS):
+        await route.abort()
+    else:
+        await route.continue_()
+
+async def lookup(context, sem, house_number, street_name, zip_code):
+    """Look one address up in its own tab; return (site_data, error_text)."""
+    async with sem:
+        page = await context.new_page()
+        try:
+            await page.goto(SITE_URL)
+            await page.fill("#txtHouseNumber", house_number)
+            await page.fill("#txtStreetName", street_name)
+            await page.fill("#txtZipcode", zip_code)
+            await page.click('button:text-is("Find My Site")')
 
-# === Step 5: Process each row and update values ===
-for index, row in df.iterrows():
+            # Advance as soon as results (or an error) show up
+            try:
+                await page.wait_for_function(RESULTS_READY_JS, polling=POLL_MS)
+            except PlaywrightTimeoutError:
+                pass  # nothing rendered — the read below comes back empty
+
+            site_data = await page.evaluate(READ_RESULTS_JS)
+            error_text = site_data.pop("error")
+            if error_text:
+                return {}, error_text
+            return site_data, ""
+        finally:
+            await page.close()
+
+def load_checkpoint(path):
+    """Unexpired answers saved by an interrupted run, as {(house, street, zip): (site_data, error_text)}."""
+    if not os.path.exists(path):
+        return {}
     try:
-        house_number = str(row['HOUSE #']).strip()
-        street_name = str(row['STREET NAME']).strip()
-        zip_code = str(row['ZIP CODE']).strip()
+        saved = pd.read_csv(path, dtype=str, keep_default_na=False)
+        with open(path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            cut_off = f.read() != b"\n"
+        if cut_off:  # last line was cut off mid-write; drop it so appends start clean
+            saved = saved.iloc[:-1]
+            saved.to_csv(path, index=False)
+        fetched = pd.to_numeric(saved["fetched"], errors="coerce")
+    except Exception as e:
+        log.warning("Ignoring unreadable checkpoint %s: %s", path, e)
+        os.remove(path)  # new answers would otherwise be appended to the broken file
+        return {}
+    max_age = (saved["error"] == "").map({True: CHECKPOINT_DAYS * 86400, False: CHECKPOINT_MESSAGE_HOURS * 3600})
+    saved = saved[fetched > time.time() - max_age]
+    return {
+        (r["house"], r["street"], r["zip"]): ({} if r["error"] else {c: r[c] for c in OUTPUT_COLS}, r["error"])
+        for r in saved.to_dict("records")
+    }
 
-        if not all([house_number, street_name, zip_code]):
-            print(f"[Row {index}] Skipped — missing address data.")
-            continue
+def write_checkpoint(path, finished):
+    """Append [(key, (site_data, error_text)), ...] to the checkpoint CSV."""
+    now = time.time()
+    rows = [
+        {"house": key[0], "street": key[1], "zip": key[2], "error": error_text, "fetched": now, **site_data}
+        for key, (site_data, error_text) in finished
+    ]
+    pd.DataFrame(rows, columns=["house", "street", "zip", "error", "fetched"] + OUTPUT_COLS).to_csv(
+        path, mode="a", header=not os.path.exists(path), index=False
+    )
+
+async def lookup_all(tasks, done, checkpoint_path):
+    """Look up every address not already in `done`, in one Edge instance with at most
+    MAX_PAGES tabs at once, checkpointing answers as they come in. Results keyed by row."""
+    # One lookup per distinct (house, street, zip); repeated addresses share
+    # it, whether it finds districts or an invalid-address message
+    todo = list(dict.fromkeys(t[1:4] for t in tasks if t[1:4] not in done))
+    by_key = dict(done)
+    if not todo:
+        return {t[0]: by_key[t[1:4]] for t in tasks}
+
+    finished = []
+
+    async def lookup_and_record(key):
+        result = await lookup(context, sem, *key)
+        site_data, error_text = result
+        if error_text or any(site_data.values()):  # empty answers get retried next run
+            finished.append((key, result))
+            if len(finished) >= CHECKPOINT_EVERY:
+                write_checkpoint(checkpoint_path, finished)
+                finished.clear()
+        return result
 
-        print(f"\n[Row {index}] Checking: {house_number} {street_name}, {zip_code}")
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(
+            channel="msedge",
+            headless=HEADLESS,
+            args=["--disable-gpu", "--blink-settings=imagesEnabled=false"],
+        )
+        context = await browser.new_context(viewport={"width": 1000, "height": 800})
+        context.set_default_timeout(WAIT_MS)  # every goto/fill/click/wait in lookup()
+        await context.route("**/*", block_extras)
+        sem = asyncio.Semaphore(MAX_PAGES)
 
-        # Load site fresh
-        driver.get("about:blank")
-        time.sleep(0.5)
-        driver.get("https://findmypollsite.vote.nyc/")
-        wait = WebDriverWait(driver, 10)
-        time.sleep(1)
+        try:
+            results = await asyncio.gather(
+                *[lookup_and_record(key) for key in todo],
+                return_exceptions=True,  # one failed row shouldn't stop the rest
+            )
+        finally:
+            # Also on Ctrl+C (the gather is cancelled): keep what already finished
+            if finished:
+                write_checkpoint(checkpoint_path, finished)
+        await browser.close()
 
-        # Fill out form
-        wait.until(EC.presence_of_element_located((By.ID, "txtHouseNumber"))).send_keys(house_number)
-        wait.until(EC.presence_of_element_located((By.ID, "txtStreetName"))).send_keys(street_name)
-        wait.until(EC.presence_of_element_located((By.ID, "txtZipcode"))).send_keys(zip_code)
+    by_key.update(zip(todo, results))
+    return {t[0]: by_key[t[1:4]] for t in tasks}
 
-        time.sleep(0.5)
-        wait.until(EC.element_to_be_clickable((By.XPATH, "//button[text()='Find My Site']"))).click()
+def save_xlsx(df, path):
+    # Streams rows in order (constant_memory), since to_excel goes column by column.
+    # Same cell text as the input: no auto-links for http:// or mailto: values.
+    wb = xlsxwriter.Workbook(path, {"constant_memory": True, "strings_to_urls": False})
+    ws = wb.add_worksheet()
+    ws.write_row(0, 0, list(df.columns), wb.add_format({"bold": True}))
+    cells = df.astype(object).where(df.notna(), None)   # NaN -> blank cell
+    for r, values in enumerate(cells.itertuples(index=False, name=None), start=1):
+        ws.write_row(r, 0, values)
+    wb.close()
 
-        time.sleep(2)
+# Track invalid rows, and changed cells (written back in one go after the loop)
+invalid_rows = []
+updates = {}
+
+# Columns read for each row
+ADDRESS_COLS = ["HOUSE #", "STREET NAME", "ZIP CODE"]
+OUTPUT_COLS = ["AD", "ED", "Cong D", "SD", "Council D", "JD"]
+for col in OUTPUT_COLS:
+    if col not in df.columns:
+        df[col] = ""
+
+# === Step 5: Look up every address ===
+tasks = []
+for index, *values in df[ADDRESS_COLS + OUTPUT_COLS].itertuples(index=True, name=None):
+    house_number, street_name, zip_code = (str(v).strip() for v in values[:3])
+    if not all([house_number, street_name, zip_code]):
+        log.warning("[Row %s] Skipped — missing address data.", index)
+        continue
+    tasks.append((index, house_number, street_name, zip_code, dict(zip(OUTPUT_COLS, values[3:]))))
+
+# Answers are checkpointed as they arrive; a rerun on the same sheet after a
+# crash or Ctrl+C picks up from there instead of starting over
+base_name = os.path.splitext(file_path)[0]
+checkpoint_path = f"{base_name}_checkpoint.csv"
+done = load_checkpoint(checkpoint_path)
+if done:
+    log.info("Resuming: %d addresses already looked up (%s)", len(done), checkpoint_path)
+
+results = asyncio.run(lookup_all(tasks, done, checkpoint_path))
+
+# === Step 6: Compare and update values, in row order ===
+for index, house_number, street_name, zip_code, current in tasks:
+    try:
+        log.info("\n[Row %s] Checking: %s %s, %s", index, house_number, street_name, zip_code)
+
+        result = results[index]
+        if isinstance(result, Exception):
+            raise result
+        site_data, error_text = result
 
         # === Check for invalid address message ===
-        error_msg_element = driver.find_elements(By.ID, "divMessage")
-        if error_msg_element and error_msg_element[0].text.strip():
-            error_text = error_msg_element[0].text.strip()
-            print(f"   ❌ Invalid or unrecognized address: {error_text}")
+        if error_text:
+            log.info("   ❌ Invalid or unrecognized address: %s", error_text)
             invalid_rows.append({
                 "row": index,
                 "house": house_number,
@@ -85,19 +249,9 @@ for index, row in df.iterrows():
             })
             continue
 
-        # === Scrape data from results page ===
-        site_data = {
-            "AD": safe_get_text(By.ID, "assembly_district"),
-            "ED": safe_get_text(By.ID, "election_district").split("/")[0],
-            "Cong D": safe_get_text(By.ID, "congress_district"),
-            "SD": safe_get_text(By.ID, "senate_district"),
-            "Council D": safe_get_text(By.ID, "council_district"),
-            "JD": safe_get_text(By.ID, "judicial_district")
-        }
-
         # Check if all scraped fields are empty — treat as invalid
         if all(not val for val in site_data.values()):
-            print("   ❌ No polling information returned — possibly invalid address.")
+            log.info("   ❌ No polling information returned — possibly invalid address.")
             invalid_rows.append({
                 "row": index,
                 "house": house_number,
@@ -110,17 +264,17 @@ for index, row in df.iterrows():
         # === Compare and update values ===
         all_match = True
         for field, site_val in site_data.items():
-            excel_val = str(row[field]).zfill(len(site_val)) if pd.notna(row[field]) else ""
+            excel_val = str(current[field]).zfill(len(site_val)) if pd.notna(current[field]) else ""
             if excel_val != site_val:
-                df.at[index, field] = site_val
-                print(f"   Updated {field}: {excel_val} → {site_val}")
+                updates.setdefault(index, {})[field] = site_val
+                log.info("   Updated %s: %s → %s", field, excel_val, site_val)
                 all_match = False
 
         if all_match:
-            print("   ✅ All fields correct.")
+            log.info("   ✅ All fields correct.")
 
     except Exception as e:
-        print(f"[Row {index}] ❌ Error: {e}")
+        log.warning("[Row %s] ❌ Error: %s", index, e)
         invalid_rows.append({
             "row": index,
             "house": house_number,
@@ -130,8 +284,11 @@ for index, row in df.iterrows():
         })
         continue
 
-# === Step 6: Save corrected Excel file with unique name ===
-base_name = os.path.splitext(file_path)[0]
+# Only the changed cells are set (unchanged ones are NaN here, which update() skips)
+if updates:
+    df.update(pd.DataFrame.from_dict(updates, orient="index"))
+
+# === Step 7: Save corrected Excel file with unique name ===
 output_path = f"{base_name}_corrected.xlsx"
 
 i = 1
@@ -139,13 +296,16 @@ while os.path.exists(output_path):
     output_path = f"{base_name}_corrected({i}).xlsx"
     i += 1
 
-df.to_excel(output_path, index=False)
-print(f"\n✅ Done! Corrected file saved to: {output_path}")
+save_xlsx(df, output_path)
+# WARNING so the saved path shows even with VERBOSE off
+log.warning("\n✅ Done! Corrected file saved to: %s", output_path)
+
+# Finished cleanly — the next run should start fresh
+if os.path.exists(checkpoint_path):
+    os.remove(checkpoint_path)
 
-# === Step 7: Print summary of invalid rows ===
+# === Step 8: Print summary of invalid rows ===
 if invalid_rows:
-    print("\n⚠️ The following addresses could not be processed:")
+    log.warning("\n⚠️ The following addresses could not be processed:")
     for row in invalid_rows:
-        print(f"   [Row {row['row']}] {row['house']} {row['street']}, {row['zip']} — {row['reason']}")
-
-driver.quit()
+        log.warning("   [Row %s] %s %s, %s — %s", row["row"], row["house"], row["street"], row["zip"], row["reason"])
@@ -1,22 +1,47 @@
 import os
 import re
-import time
+import sys
+import queue
+import atexit
+import logging
 import math
+import json
+import time
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
 import pandas as pd
+import xlsxwriter
 from tkinter import Tk
 from tkinter.filedialog import askopenfilename
-from selenium import webdriver
-from selenium.webdriver.edge.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+import requests
+import lxml.html
+import lxml.etree
 
 # =========================
 # Config
 # =========================
-EDGE_DRIVER_PATH = "msedgedriver.exe"  # change if needed
 SITE_URL = "https://findmypollsite.vote.nyc/"
+REQUEST_TIMEOUT = 15  # seconds per HTTP request
+MAX_WORKERS = 12      # concurrent lookups; lower this if the site starts refusing requests
+PROBE_ADDRESSES = 3   # looked up first; the run stops only if all of them come back empty
+CACHE_PATH = "poll_cache.sqlite"  # lookups are remembered here between runs
+CACHE_DAYS = 30                   # re-check an address once its cached answer is older than this
+CACHE_MESSAGE_HOURS = 6           # same for site messages ("invalid address" — or "try again later")
 OUTPUT_COLS = ["AD", "ED", "Cong D", "SD", "Council D", "JD"]
+VERBOSE = True        # per-row progress; False shows only problems and the result
+
+# Element ids on the site: address inputs, and where each output column is read from
+FORM_IDS = {"house": "txtHouseNumber", "street": "txtStreetName", "zip": "txtZipcode"}
+RESULT_IDS = {
+    "AD":        "assembly_district",
+    "ED":        "election_district",
+    "Cong D":    "congress_district",
+    "SD":        "senate_district",
+    "Council D": "council_district",
+    "JD":        "judicial_district",
+}
 
 # Accept both short headers and bilingual headers
 EXACT_NAMES = {
@@ -34,8 +59,8 @@ EXACT_NAMES = {
     ],
 }
 
-# Regex fallbacks (flexible)
-REQUIRED_PATTERNS = {
+# Regex fallbacks (flexible) — compiled once below
+_PATTERN_SOURCES = {
     "house": [
         r"\bhouse\s*number\b",
         r"\bhouse\s*#(?:\s|$)",   # handles literal "HOUSE #"
@@ -51,13 +76,45 @@ REQUIRED_PATTERNS = {
         r"邮政编码"
     ],
 }
+# Each list becomes one alternation; group p<N> matching means pattern N (its rank) matched
+REQUIRED_PATTERNS = {
+    key: re.compile("|".join(f"(?P<p{rank}>{pat})" for rank, pat in enumerate(pats)))
+    for key, pats in _PATTERN_SOURCES.items()
+}
+
+# Patterns used by the helpers, compiled once at import
+_WS       = re.compile(r"\s+")
+_DOT0     = re.compile(r"\.0$")
+_NONDIGIT = re.compile(r"[^\d]")
+_PARENS   = re.compile(r"\(.*?\)")
+_BY_ID    = lxml.etree.XPath("//*[@id=$id]")
+# Text nodes a browser would render: not inside <script>/<style>, nor under an
+# element hidden with the `hidden` attribute or an inline display:none
+_VISIBLE_TEXT = lxml.etree.XPath(
+    ".//text()[not(ancestor::script or ancestor::style or ancestor::*[@hidden]"
+    " or ancestor::*[contains(translate(@style, ' ', ''), 'display:none')])]"
+)
+
+# =========================
+# Logging
+# =========================
+log = logging.getLogger("poll")
+log.setLevel(logging.INFO if VERBOSE else logging.WARNING)
+log.propagate = False
+# Messages go through a queue and a background thread does the console writes,
+# so the row loop never blocks on a slow (e.g. Windows) console
+_log_queue = queue.Queue()
+log.addHandler(QueueHandler(_log_queue))
+_log_listener = QueueListener(_log_queue, logging.StreamHandler(sys.stdout))
+_log_listener.start()
+atexit.register(_log_listener.stop)  # flush what's queued on any exit
 
 # =========================
 # Helpers
 # =========================
 def norm_keep_symbols(s: str) -> str:
-    s = re.sub(r"\s+", " ", str(s)).strip().lower()
-    s = re.sub(r"\(.*?\)", "", s)  # drop "(ex: 3514)"
+    s = _WS.sub(" ", str(s)).strip().lower()
+    s = _PARENS.sub("", s)  # drop "(ex: 3514)"
     s = s.replace("/", " ")
     return s
 
@@ -68,15 +125,20 @@ def find_exact(df, names):
             return col
     return None
 
-def find_regex(df, patterns):
+def find_regex(df, pattern):
     best = None
     for col in df.columns:
         c = norm_keep_symbols(col)
-        for rank, pat in enumerate(patterns):
-            if re.search(pat, c):
-                if best is None or (rank, -len(c)) < best[0]:
-                    best = ((rank, -len(c)), col)
+        # Best (lowest) rank among the alternatives found in this header
+        rank = None
+        for m in pattern.finditer(c):
+            r = int(m.lastgroup[1:])
+            if rank is None or r < rank:
+                rank = r
+            if rank == 0:
                 break
+        if rank is not None and (best is None or (rank, -len(c)) < best[0]):
+            best = ((rank, -len(c)), col)
     return None if best is None else best[1]
 
 def safe_text(x) -> str:
@@ -100,33 +162,131 @@ def safe_text(x) -> str:
     # everything else
     return str(x)
 
-def clean_house(x) -> str:
-    s = safe_text(x).strip()
-    s = re.sub(r"\.0$", "", s)          # "1876.0" -> "1876"
-    s = re.sub(r"\s+", " ", s)
-    return s
-
-def clean_street(x) -> str:
-    s = safe_text(x).strip().upper()
-    s = re.sub(r"\s+", " ", s)          # collapse multiple spaces
+# Column-wise cleaners: operate on a whole column at once, blanks become ""
+def clean_house(col: pd.Series) -> pd.Series:
+    s = col.astype("string").fillna("").str.strip()
+    s = s.str.replace(_DOT0, "", regex=True)           # "1876.0" -> "1876"
+    s = s.str.replace(_WS, " ", regex=True)
     return s
 
-def clean_zip(x) -> str:
-    s = safe_text(x).strip()
-    s = re.sub(r"[^\d]", "", s)         # keep digits only
-    if len(s) == 4:                      # e.g., "1120" -> "01120"
-        s = s.zfill(5)
-    if len(s) >= 5:
-        s = s[:5]                        # use 5-digit ZIP
+def clean_street(col: pd.Series) -> pd.Series:
+    s = col.astype("string").fillna("").str.strip().str.upper()
+    s = s.str.replace(_WS, " ", regex=True)            # collapse multiple spaces
     return s
 
-def safe_get_text(driver, by, value, fallback=""):
-    try:
-        elem = driver.find_element(by, value)
-        txt = elem.text.strip() if elem and elem.text else ""
-        return txt or fallback
-    except Exception:
-        return fallback
+def clean_zip(col: pd.Series) -> pd.Series:
+    s = col.astype("string").fillna("").str.strip()
+    s = s.str.replace(_NONDIGIT, "", regex=True)       # keep digits only
+    s = s.mask(s.str.len() == 4, s.str.zfill(5))       # e.g., "1120" -> "01120"
+    return s.str.slice(0, 5)                           # use 5-digit ZIP
+
+def text_by_id(doc, elem_id, fallback=""):
+    # Only visible text, like Selenium's .text. Elements hidden by a stylesheet
+    # class can't be told apart without a browser and are still read.
+    nodes = _BY_ID(doc, id=elem_id)
+    txt = "".join(_VISIBLE_TEXT(nodes[0])).strip() if nodes else ""
+    return txt or fallback
+
+def load_form(session):
+    """GET the search page once; return where/how the address form submits and its hidden fields."""
+    resp = session.get(SITE_URL, timeout=REQUEST_TIMEOUT)
+    resp.raise_for_status()
+    doc = lxml.html.fromstring(resp.content, base_url=resp.url)
+
+    inputs = {key: doc.xpath(f'//input[@id="{elem_id}"]') for key, elem_id in FORM_IDS.items()}
+    missing = [FORM_IDS[key] for key, found in inputs.items() if not found]
+    if missing:
+        raise RuntimeError(f"address form not found on page (missing {', '.join(missing)})")
+    form = next(inputs["house"][0].iterancestors("form"), None)
+    if form is None:
+        raise RuntimeError("address fields are not inside a <form>")
+
+    values = dict(form.form_values())   # hidden inputs (view state, tokens, ...)
+    # A named submit button is part of the POST body too
+    for btn in form.xpath(".//button[normalize-space()='Find My Site'] | .//input[@type='submit']"):
+        if btn.get("name"):
+            values[btn.get("name")] = btn.get("value", "")
+            break
+
+    return {
+        "url": form.action or resp.url,
+        "method": form.method,
+        "values": values,
+        "names": {key: found[0].get("name") or found[0].get("id") for key, found in inputs.items()},
+    }
+
+def fetch_districts(session, form, house_number, street_name, zip_code):
+    """Submit one address; return (site_data, error_text). error_text is "" on success."""
+    data = dict(form["values"])
+    data[form["names"]["house"]]  = house_number
+    data[form["names"]["street"]] = street_name
+    data[form["names"]["zip"]]    = zip_code
+
+    if form["method"] == "POST":
+        resp = session.post(form["url"], data=data, timeout=REQUEST_TIMEOUT)
+    else:
+        resp = session.get(form["url"], params=data, timeout=REQUEST_TIMEOUT)
+    resp.raise_for_status()
+    doc = lxml.html.fromstring(resp.content)
+
+    # A page with neither block isn't a results page (e.g. the site filled them
+    # in with JavaScript) — that's not the same as "no polling info"
+    if not any(_BY_ID(doc, id=elem_id) for elem_id in ["divMessage", *RESULT_IDS.values()]):
+        raise RuntimeError("response has no result or message block — site layout may have changed")
+
+    error_text = text_by_id(doc, "divMessage")
+    if error_text:
+        return {}, error_text
+
+    site_data = {field: text_by_id(doc, elem_id) for field, elem_id in RESULT_IDS.items()}
+    site_data["ED"] = site_data["ED"].split("/")[0]
+    return site_data, ""
+
+def save_xlsx(df, path):
+    """Write the sheet row by row; xlsxwriter's constant_memory mode keeps only one row in RAM."""
+    # (DataFrame.to_excel writes column by column, which constant_memory can't take.)
+    # strings_to_urls off: cells are written exactly as read, never turned into links
+    wb = xlsxwriter.Workbook(path, {"constant_memory": True, "strings_to_urls": False})
+    ws = wb.add_worksheet()
+    ws.write_row(0, 0, list(df.columns), wb.add_format({"bold": True}))
+    cells = df.astype(object).where(df.notna(), None)   # NaN -> blank cell
+    for r, values in enumerate(cells.itertuples(index=False, name=None), start=1):
+        ws.write_row(r, 0, values)
+    wb.close()
+
+def open_cache(path):
+    # autocommit: an interrupted run keeps what it fetched. Each thread opens its own
+    # connection; check_same_thread is off only so the main thread can close them all
+    conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS lookups (
+            house TEXT, street TEXT, zip TEXT,
+            site_data TEXT, error TEXT, fetched REAL,
+            PRIMARY KEY (house, street, zip)
+        )""")
+    return conn
+
+def load_cache(conn):
+    """Every unexpired cached answer, as {(house, street, zip): (site_data, error_text)}."""
+    rows = conn.execute(
+        "SELECT house, street, zip, site_data, error FROM lookups"
+        " WHERE fetched > CASE WHEN error = '' THEN ? ELSE ? END",
+        (time.time() - CACHE_DAYS * 86400, time.time() - CACHE_MESSAGE_HOURS * 3600),
+    )
+    return {(house, street, zip_code): (json.loads(data), error) for house, street, zip_code, data, error in rows}
+
+def cache_put(conn, key, result):
+    site_data, error_text = result
+    # Real answers are kept, and site messages for CACHE_MESSAGE_HOURS: long enough
+    # to skip known bad rows on a rerun, short enough that a transient
+    # "unavailable"/throttling message isn't trusted for long.
+    # Empty/failed responses aren't cached at all
+    if not error_text and not any(site_data.values()):
+        return
+    conn.execute(
+        "INSERT OR REPLACE INTO lookups VALUES (?, ?, ?, ?, ?, ?)",
+        (*key, json.dumps(site_data), error_text, time.time()),
+    )
 
 # =========================
 # Pick file
@@ -134,16 +294,16 @@ def safe_get_text(driver, by, value, fallback=""):
 Tk().withdraw()
 file_path = askopenfilename(title="Select Excel file", filetypes=[("Excel files", "*.xlsx")])
 if not file_path:
-    print("No file selected. Exiting.")
+    log.warning("No file selected. Exiting.")
     raise SystemExit
 
 # =========================
 # Read Excel
 # =========================
 try:
-    df = pd.read_excel(file_path, dtype=str)  # try to keep as strings
+    df = pd.read_excel(file_path, dtype=str, engine="calamine")  # try to keep as strings
 except Exception as e:
-    print(f"Error reading Excel file: {e}")
+    log.warning("Error reading Excel file: %s", e)
     raise SystemExit
 
 # =========================
@@ -153,127 +313,185 @@ house_col  = find_exact(df, EXACT_NAMES["house"])  or find_regex(df, REQUIRED_PA
 street_col = find_exact(df, EXACT_NAMES["street"]) or find_regex(df, REQUIRED_PATTERNS["street"])
 zip_col    = find_exact(df, EXACT_NAMES["zip"])    or find_regex(df, REQUIRED_PATTERNS["zip"])
 
-print("\nDetected columns:")
-print("  House:  ", house_col)
-print("  Street: ", street_col)
-print("  Zip:    ", zip_col)
+log.info("\nDetected columns:")
+log.info("  House:   %s", house_col)
+log.info("  Street:  %s", street_col)
+log.info("  Zip:     %s", zip_col)
 
 if not all([house_col, street_col, zip_col]):
-    print("\n❌ Could not match required columns. Here are all headers I see:")
+    log.warning("\n❌ Could not match required columns. Here are all headers I see:")
     for c in df.columns:
-        print("  -", c)
+        log.warning("  - %s", c)
     raise SystemExit
 
-# Ensure output columns exist (added at the END if missing)
+# Ensure output columns exist (added at the END if missing), as plain object
+# columns so the district strings written back later don't force a dtype change
 for col in OUTPUT_COLS:
     if col not in df.columns:
         df[col] = ""
+df[OUTPUT_COLS] = df[OUTPUT_COLS].astype(object)
 
 # =========================
-# Set up Edge WebDriver
+# Set up HTTP session
 # =========================
-options = webdriver.EdgeOptions()
-options.add_argument("window-size=1000,800")
-driver = webdriver.Edge(service=Service(EDGE_DRIVER_PATH), options=options)
-driver.set_window_position(100, 100)
+session = requests.Session()
+try:
+    form = load_form(session)  # fetched once; every row reuses it
+except Exception as e:
+    log.warning("Error loading %s: %s", SITE_URL, e)
+    raise SystemExit
+
+# requests.Session isn't thread-safe: each worker thread gets its own,
+# seeded with the cookies from the page load above, and its own cache connection
+_local = threading.local()
+_thread_sessions = []
+_thread_caches = []
+
+def lookup(house_number, street_name, zip_code):
+    if not hasattr(_local, "session"):
+        _local.session = requests.Session()
+        _local.session.cookies.update(session.cookies)
+        _thread_sessions.append(_local.session)
+        _local.cache = open_cache(CACHE_PATH)
+        _thread_caches.append(_local.cache)
+    result = fetch_districts(_local.session, form, house_number, street_name, zip_code)
+    # Saved as soon as it arrives, not when the row loop gets to it, so an
+    # interrupted run keeps every answer it fetched
+    cache_put(_local.cache, (house_number, street_name, zip_code), result)
+    return result
 
 invalid_rows = []
 
 # =========================
-# Process each row
+# Clean inputs
 # =========================
-for index, row in df.iterrows():
-    house_number, street_name, zip_code = "", "", ""
+CLEAN_COLS = ["_house", "_street", "_zip"]   # scratch columns, dropped before saving
+df["_house"]  = clean_house(df[house_col])
+df["_street"] = clean_street(df[street_col])
+df["_zip"]    = clean_zip(df[zip_col])
+
+tasks = []
+for index, house_number, street_name, zip_code in df[CLEAN_COLS].itertuples(index=True, name=None):
+    if not all([house_number, street_name, zip_code]):
+        log.warning("[Row %s] Skipped — missing address data.", index)
+        continue
+
+    tasks.append((index, house_number, street_name, zip_code))
+
+# Each distinct address is looked up once, and not at all if a previous run cached it.
+# The whole cache is read into `seen` in one query; rows then only do dict lookups.
+cache = open_cache(CACHE_PATH)
+seen = load_cache(cache)
+unique_keys = list(dict.fromkeys(t[1:] for t in tasks))
+
+# Check the first few addresses the slow way before starting the pool, so a site
+# that doesn't answer the form with a results page stops the run here rather than
+# marking every row invalid. A page without the result/message blocks is caught
+# by fetch_districts; one bad address can come back empty, so only all of them
+# doing so counts. A network error is retried once before giving up.
+def probe(key):
     try:
-        # Clean inputs safely (prevents 'float' has no attribute 'strip')
-        house_number = clean_house(row.get(house_col, ""))
-        street_name  = clean_street(row.get(street_col, ""))
-        zip_code     = clean_zip(row.get(zip_col, ""))
-
-        if not all([house_number, street_name, zip_code]):
-            print(f"[Row {index}] Skipped — missing address data.")
-            continue
-
-        print(f"\n[Row {index}] Checking: {house_number} {street_name}, {zip_code}")
-
-        # Fresh page
-        driver.get("about:blank")
-        time.sleep(0.5)
-        driver.get(SITE_URL)
-        wait = WebDriverWait(driver, 12)
-        time.sleep(1)
-
-        # Fill form
-        hn = wait.until(EC.presence_of_element_located((By.ID, "txtHouseNumber")))
-        hn.clear(); hn.send_keys(house_number)
-
-        st = wait.until(EC.presence_of_element_located((By.ID, "txtStreetName")))
-        st.clear(); st.send_keys(street_name)
-
-        zp = wait.until(EC.presence_of_element_located((By.ID, "txtZipcode")))
-        zp.clear(); zp.send_keys(zip_code)
-
-        time.sleep(0.4)
-        wait.until(EC.element_to_be_clickable((By.XPATH, "//button[normalize-space()='Find My Site']"))).click()
-        time.sleep(2)
-
-        # Invalid address message?
-        error_msg_element = driver.find_elements(By.ID, "divMessage")
-        if error_msg_element and error_msg_element[0].text.strip():
-            error_text = error_msg_element[0].text.strip()
-            print(f"   ❌ Invalid or unrecognized address: {error_text}")
-            invalid_rows.append({
-                "row": index,
-                "house": house_number,
-                "street": street_name,
-                "zip": zip_code,
-                "reason": error_text
-            })
-            continue
-
-        # Scrape results
-        site_data = {
-            "AD":         safe_get_text(driver, By.ID, "assembly_district"),
-            "ED":         safe_get_text(driver, By.ID, "election_district").split("/")[0],
-            "Cong D":     safe_get_text(driver, By.ID, "congress_district"),
-            "SD":         safe_get_text(driver, By.ID, "senate_district"),
-            "Council D":  safe_get_text(driver, By.ID, "council_district"),
-            "JD":         safe_get_text(driver, By.ID, "judicial_district"),
-        }
-
-        if all(not v for v in site_data.values()):
-            print("   ❌ No polling information returned — possibly invalid address.")
-            invalid_rows.append({
-                "row": index,
-                "house": house_number,
-                "street": street_name,
-                "zip": zip_code,
-                "reason": "No polling info returned"
-            })
-            continue
-
-        # Update output columns
-        all_match = True
-        for field, site_val in site_data.items():
-            excel_val = safe_text(row.get(field, "")).strip()
-            if excel_val != site_val:
-                df.at[index, field] = site_val
-                print(f"   Updated {field}: {excel_val or '∅'} → {site_val}")
-                all_match = False
-
-        if all_match:
-            print("   ✅ All fields correct.")
+        return fetch_districts(session, form, *key)
+    except requests.RequestException:
+        return fetch_districts(session, form, *key)
 
+to_fetch = [key for key in unique_keys if key not in seen]
+prefetched = {}
+for key in to_fetch[:PROBE_ADDRESSES]:
+    try:
+        prefetched[key] = probe(key)
     except Exception as e:
-        print(f"[Row {index}] ❌ Error: {e}")
-        invalid_rows.append({
-            "row": index,
-            "house": house_number,
-            "street": street_name,
-            "zip": zip_code,
-            "reason": f"Script error: {e}"
-        })
-        continue
+        log.warning("Error checking the lookup against %s with %s: %s", SITE_URL, " ".join(key), e)
+        raise SystemExit
+    cache_put(cache, key, prefetched[key])
+    site_data, error_text = prefetched[key]
+    if error_text or any(site_data.values()):
+        break   # the site answers; no need to probe further
+else:
+    if len(prefetched) == PROBE_ADDRESSES:
+        log.warning("\n❌ %s returned no districts and no message for any of the first %d addresses.\n"
+                    "   The site may now fill in results with JavaScript, or its layout has changed.",
+                    SITE_URL, PROBE_ADDRESSES)
+        raise SystemExit
+
+log.info("\n%d addresses, %d distinct, %d already cached.",
+         len(tasks), len(unique_keys), len(unique_keys) - len(to_fetch))
+
+# =========================
+# Process each row
+# =========================
+# Lookups run in parallel; results are reported in row order as they arrive.
+# Changed cells are collected and written back in one go at the end.
+updates = {}
+with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+    futures = {key: ex.submit(lookup, *key) for key in to_fetch if key not in prefetched}
+
+    try:
+        for index, house_number, street_name, zip_code in tasks:
+            key = (house_number, street_name, zip_code)
+            try:
+                log.info("\n[Row %s] Checking: %s %s, %s", index, house_number, street_name, zip_code)
+
+                if key in seen:
+                    site_data, error_text = seen[key]
+                else:
+                    # (already in the cache: lookup() saved it when it arrived)
+                    site_data, error_text = prefetched[key] if key in prefetched else futures[key].result()
+
+                # Invalid address message?
+                if error_text:
+                    log.info("   ❌ Invalid or unrecognized address: %s", error_text)
+                    invalid_rows.append({
+                        "row": index,
+                        "house": house_number,
+                        "street": street_name,
+                        "zip": zip_code,
+                        "reason": error_text
+                    })
+                    continue
+
+                if all(not v for v in site_data.values()):
+                    log.info("   ❌ No polling information returned — possibly invalid address.")
+                    invalid_rows.append({
+                        "row": index,
+                        "house": house_number,
+                        "street": street_name,
+                        "zip": zip_code,
+                        "reason": "No polling info returned"
+                    })
+                    continue
+
+                # Update output columns
+                all_match = True
+                for field, site_val in site_data.items():
+                    excel_val = safe_text(df.at[index, field]).strip()
+                    if excel_val != site_val:
+                        updates.setdefault(index, {})[field] = site_val
+                        log.info("   Updated %s: %s → %s", field, excel_val or "∅", site_val)
+                        all_match = False
+
+                if all_match:
+                    log.info("   ✅ All fields correct.")
+
+            except Exception as e:
+                log.warning("[Row %s] ❌ Error: %s", index, e)
+                invalid_rows.append({
+                    "row": index,
+                    "house": house_number,
+                    "street": street_name,
+                    "zip": zip_code,
+                    "reason": f"Script error: {e}"
+                })
+                continue
+    except BaseException:
+        # Ctrl+C (or a crash) shouldn't leave the pool's exit running every queued
+        # lookup: drop what hasn't started; the in-flight ones just finish
+        ex.shutdown(wait=False, cancel_futures=True)
+        raise
+
+# Only the changed cells are set (unchanged ones are NaN here, which update() skips)
+if updates:
+    df.update(pd.DataFrame.from_dict(updates, orient="index"))
 
 # =========================
 # Save output
@@ -285,15 +503,21 @@ while os.path.exists(output_path):
     output_path = f"{base_name}_with_districts({i}).xlsx"
     i += 1
 
-df.to_excel(output_path, index=False)
-print(f"\n✅ Done! File saved to: {output_path}")
+save_xlsx(df.drop(columns=CLEAN_COLS), output_path)
+# WARNING so the saved path shows even with VERBOSE off
+log.warning("\n✅ Done! File saved to: %s", output_path)
 
 # =========================
 # Summary of invalid rows
 # =========================
 if invalid_rows:
-    print("\n⚠️ Addresses that could not be processed:")
+    log.warning("\n⚠️ Addresses that could not be processed:")
     for r in invalid_rows:
-        print(f"   [Row {r['row']}] {r['house']} {r['street']}, {r['zip']} — {r['reason']}")
-
-driver.quit()
+        log.warning("   [Row %s] %s %s, %s — %s", r["row"], r["house"], r["street"], r["zip"], r["reason"])
+
+cache.close()
+session.close()
+for ts in _thread_sessions:
+    ts.close()
+for tc in _thread_caches:
+    tc.close()